@@ -1,4 +1,5 @@
 """Boxes to store items in"""
+import functools
 import hashlib
 import logging
 
@@ -19,6 +20,9 @@ from .value_types import (
 
 logger = logging.getLogger(__name__)
 
+_DATA_ID_HASH = hashlib.blake2b(digest_size=8)
+_JOIN_COLON = ':'.join
+
 
 def calculate_data_id(origin, parent_ids=tuple(), name=None):
     """
@@ -32,14 +36,18 @@ def calculate_data_id(origin, parent_ids=tuple(), name=None):
     Returns:
          str: The data_id.
     """
-    id_origin_data = ':'.join(
-        [
-            origin,
-            name or '',
-        ]
-        + sorted(parent_ids)
-    )
-    return hashlib.blake2b(id_origin_data.encode('utf-8'), digest_size=8).hexdigest()
+    parent_ids = tuple(parent_ids)
+    if len(parent_ids) > 1:
+        parent_ids = tuple(sorted(parent_ids))
+    return _calculate_data_id(origin, name, parent_ids)
+
+
+@functools.lru_cache(maxsize=4096)
+def _calculate_data_id(origin, name, sorted_parent_ids):
+    id_origin_data = _JOIN_COLON((origin, name or '', *sorted_parent_ids))
+    data_id_hash = _DATA_ID_HASH.copy()
+    data_id_hash.update(id_origin_data.encode('utf-8'))
+    return data_id_hash.hexdigest()
 
 
 class Box:
@@ -57,13 +65,25 @@ class Box:
         self.box_id = box_id
         self.storage = storage
         self.transformers = transformers
+        bytes_value_type = BytesValueType()
+        string_value_type = StringValueType()
+        json_value_type = JsonValueType()
         self.value_types = [
-            BytesValueType(),
+            bytes_value_type,
             StreamValueType(),
-            StringValueType(),
+            string_value_type,
             FileValueType(),
-            JsonValueType(),
+            json_value_type,
         ]
+        # The last supporting value type is chosen and the default ones stay at
+        # the end of the list, so these types always resolve to the same value type.
+        self._value_types_by_type = {
+            bytes: bytes_value_type,
+            bytearray: bytes_value_type,
+            str: string_value_type,
+            dict: json_value_type,
+            list: json_value_type,
+        }
         register_box(self)
 
     def add_value_type(self, value_type):
@@ -120,9 +140,8 @@ class Box:
             tags = {}
         if meta is None:
             meta = {}
-        else:
-            meta = dict(meta)
-        origin = determine_origin(origin, name=name, tags=tags, level=3)
+        if not isinstance(origin, str):
+            origin = determine_origin(origin, name=name, tags=tags, level=3)
         logger.info("Storing value in box %s with origin %s", self.box_id, origin)
         parent_ids = tuple(p.data_id for p in parents)
         data_id = calculate_data_id(origin, parent_ids=parent_ids, name=name)
@@ -155,9 +174,11 @@ class Box:
         )
         writer.write_value(value, value_type)
 
-        meta['value_type'] = value_type.get_specification()
-        meta = dict(meta)
-        meta.update(writer.meta)
+        meta = {
+            **meta,
+            'value_type': value_type.get_specification(),
+            **writer.meta,
+        }
         data_info = DataInfo(
             DataRef.from_item(writer.item),
             origin=origin,
@@ -173,7 +194,9 @@ class Box:
         return data_info
 
     def _find_suitable_value_type(self, value):
-        value_type = None
+        value_type = self._value_types_by_type.get(type(value))
+        if value_type is not None:
+            return value_type
         for configured_value_type in self.value_types:
             if configured_value_type.supports(value):
                 value_type = configured_value_type
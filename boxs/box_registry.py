@@ -8,6 +8,7 @@ from .errors import BoxAlreadyDefined, BoxNotDefined
 logger = logging.getLogger(__name__)
 
 _BOX_REGISTRY = {}
+_MISSING = object()
 
 
 def register_box(box):
@@ -39,9 +40,8 @@ def unregister_box(box_id):
         boxs.errors.BoxNotDefined: If no box with the given id is defined.
     """
     logger.info("Unregistering box %s", box_id)
-    if box_id not in _BOX_REGISTRY:
+    if _BOX_REGISTRY.pop(box_id, _MISSING) is _MISSING:
         raise BoxNotDefined(box_id)
-    del _BOX_REGISTRY[box_id]
 
 
 def get_box(box_id=None):
@@ -64,6 +64,7 @@ def get_box(box_id=None):
         box_id = get_config().default_box
         logger.debug("Using default_box %s from config", box_id)
 
-    if box_id not in _BOX_REGISTRY:
+    box = _BOX_REGISTRY.get(box_id, _MISSING)
+    if box is _MISSING:
         raise BoxNotDefined(box_id)
-    return _BOX_REGISTRY[box_id]
+    return box
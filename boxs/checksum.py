@@ -62,23 +62,24 @@ class ChecksumTransformer(Transformer):
 
 
 class _ChecksumReader(DelegatingReader):
+    __slots__ = ('_verify', '_digest_size', '_stream', 'as_file')
+
     def __init__(self, delegate, default_digest_size):
         super().__init__(delegate)
+        meta = self.delegate.meta
         self._verify = True
-        if 'checksum_algorithm' not in self.delegate.meta:
+        if 'checksum_algorithm' not in meta:
             logger.warning(
                 "No checksum algorithm given, disabling checksum verification",
             )
             self._verify = False
-        elif self.delegate.meta['checksum_algorithm'] != 'blake2b':
+        elif meta['checksum_algorithm'] != 'blake2b':
             logger.warning(
                 "Unknown checksum algorithm '%s', disabling checksum verification",
-                self.delegate.meta['checksum_algorithm'],
+                meta['checksum_algorithm'],
             )
             self._verify = False
-        self._digest_size = self.delegate.meta.get(
-            'checksum_digest_size', default_digest_size
-        )
+        self._digest_size = meta.get('checksum_digest_size', default_digest_size)
         self._stream = None
         if hasattr(delegate, 'as_file'):
             self.as_file = self._as_file
@@ -109,6 +110,8 @@ class _ChecksumReader(DelegatingReader):
 
 
 class _ChecksumWriter(DelegatingWriter):
+    __slots__ = ('_digest_size', '_stream')
+
     def __init__(self, delegate, digest_size=None):
         super().__init__(delegate)
         self._digest_size = digest_size
@@ -117,9 +120,10 @@ class _ChecksumWriter(DelegatingWriter):
     def write_value(self, value, value_type):
         value_type.write_value_to_writer(value, self)
         checksum = self._stream.checksum
-        self.meta['checksum_digest'] = checksum
-        self.meta['checksum_digest_size'] = self._digest_size
-        self.meta['checksum_algorithm'] = 'blake2b'
+        meta = self.meta
+        meta['checksum_digest'] = checksum
+        meta['checksum_digest_size'] = self._digest_size
+        meta['checksum_algorithm'] = 'blake2b'
         logger.info("Checksum when writing %s: %s", self.item, checksum)
 
     def as_stream(self):
@@ -144,5 +148,6 @@ class _ChecksumStream(DelegatingStream):
 
     def write(self, byte_buffer):
         written = super().write(byte_buffer)
-        self.hash.update(byte_buffer[:written])
+        with memoryview(byte_buffer) as written_bytes:
+            self.hash.update(written_bytes[:written])
         return written
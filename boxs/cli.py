@@ -3,20 +3,20 @@ import argparse
 import codecs
 import collections.abc
 import datetime
+import filecmp
+import functools
 import io
 import json
 import logging
 import math
 import pathlib
 import shutil
-import subprocess
 import sys
 
 from boxs.box_registry import get_box
 from boxs.config import get_config
 from boxs.data import DataRef
 from boxs.errors import BoxsError
-from boxs.graph import write_graph_of_refs
 from boxs.storage import ItemQuery, Run
 from boxs.value_types import FileValueType
 
@@ -33,6 +33,7 @@ def main(argv=None):
             arguments are taken from `sys.argv`.
     """
     argv = argv or sys.argv[1:]
+    _terminal_columns.cache_clear()
 
     boxs_home_dir = pathlib.Path.home() / '.boxs'
     boxs_home_dir.mkdir(exist_ok=True)
@@ -53,7 +54,34 @@ def main(argv=None):
         description="Allows to inspect and manipulate boxes that are used for "
         "storing data items using the python 'boxs' library.",
     )
-    parser.set_defaults(command=lambda _: parser.print_help())
+    parser.set_defaults(command=None)
+    _add_global_arguments(parser)
+
+    subparsers = parser.add_subparsers(help="Commands")
+    _add_commands(subparsers, argv)
+
+    args = parser.parse_args(argv)
+
+    if args.command is not None or args.default_box or args.init_module:
+        # Creating the configuration imports the init module, which defines the
+        # boxes that the command might need.
+        config = get_config()
+        if args.default_box:
+            config.default_box = args.default_box
+        if args.init_module:
+            config.init_module = args.init_module
+
+    if args.command is None:
+        parser.print_help()
+        return
+
+    try:
+        args.command(args)
+    except BoxsError as error:
+        _print_error(error, args)
+
+
+def _add_global_arguments(parser):
     parser.add_argument(
         '-b',
         '--default-box',
@@ -77,33 +105,58 @@ def main(argv=None):
         help="Print output as json",
     )
 
-    subparsers = parser.add_subparsers(help="Commands")
 
-    _add_list_runs_command(subparsers)
-    _add_name_run_command(subparsers)
-    _add_delete_run_command(subparsers)
-    _add_clean_runs_command(subparsers)
+def _add_commands(subparsers, argv):
+    add_command_functions = {
+        'list-runs': _add_list_runs_command,
+        'name-run': _add_name_run_command,
+        'delete-run': _add_delete_run_command,
+        'clean-runs': _add_clean_runs_command,
+        'list': _add_list_command,
+        'info': _add_info_command,
+        'diff': _add_diff_command,
+        'export': _add_export_command,
+        'graph': _add_graph_command,
+    }
+    command = _find_command_in_args(argv)
+    if command in add_command_functions:
+        # Only the parser of the called command is needed, all the others are
+        # only used for showing the help.
+        add_command_functions[command](subparsers)
+        return
+    for add_command_function in add_command_functions.values():
+        add_command_function(subparsers)
+
 
-    _add_list_command(subparsers)
-    _add_info_command(subparsers)
-    _add_diff_command(subparsers)
+class _CommandFinderError(Exception):
+    pass
 
-    _add_export_command(subparsers)
-    _add_graph_command(subparsers)
 
-    args = parser.parse_args(argv)
+class _CommandFinder(argparse.ArgumentParser):
+    """Parser that only parses the global arguments to find the command."""
 
-    config = get_config()
+    def __init__(self):
+        super().__init__(add_help=False)
+        self.add_argument('-h', '--help', action='store_true')
+        _add_global_arguments(self)
 
-    if args.default_box:
-        config.default_box = args.default_box
-    if args.init_module:
-        config.init_module = args.init_module
+    def error(self, message):
+        raise _CommandFinderError(message)
 
+
+def _find_command_in_args(argv):
+    # The global arguments are parsed the same way as by the real parser, so that
+    # combined short options and abbreviated long options are handled, too.
     try:
-        args.command(args)
-    except BoxsError as error:
-        _print_error(error, args)
+        args, remaining_argv = _CommandFinder().parse_known_args(argv)
+    except _CommandFinderError:
+        return None
+    if args.help:
+        return None
+    for arg in remaining_argv:
+        if not arg.startswith('-'):
+            return arg
+    return None
 
 
 def _add_list_runs_command(subparsers):
@@ -167,7 +220,7 @@ def name_run_command(args):
     """
     box = get_box()
     storage = box.storage
-    run = _get_run_from_args(args)
+    run = _get_run_from_args(args, box)
     if run is None:
         return
     logger.info(
@@ -206,7 +259,7 @@ def delete_run_command(args):
     """
     box = get_box()
     storage = box.storage
-    run = _get_run_from_args(args)
+    run = _get_run_from_args(args, box)
     if run is None:
         return
     logger.info(
@@ -438,16 +491,12 @@ def diff_command(args):
     Args:
         args (argparse.Namespace): The parsed arguments from command line.
     """
+    import subprocess  # pylint: disable=import-outside-toplevel
 
     def _get_data_item_as_file(ref):
         return ref.load(value_type=FileValueType())
 
-    results = []
-    for obj_string in args.queries:
-        item_query = _parse_query(obj_string)
-        box = get_box(item_query.box)
-        item_query.box = box.box_id
-        results.append(box.storage.list_items(item_query))
+    results = _list_items_for_queries(args.queries)
 
     if len(results[0]) == 1 and len(results[1]) == 1:
         first_ref = DataRef.from_item(results[0][0])
@@ -463,6 +512,10 @@ def diff_command(args):
         second_file_path = _get_data_item_as_file(second_ref)
         second_label = args.queries[1]
 
+        if _diff_output_is_empty(args, first_file_path, second_file_path):
+            logger.info("Items are identical, skip calling diff")
+            return
+
         command = [args.diff, str(first_file_path), str(second_file_path)]
         if args.labels:
             command.extend(
@@ -480,6 +533,30 @@ def diff_command(args):
         _print_error("Ambiguous values to diff.", args)
 
 
+def _list_items_for_queries(query_strings):
+    # Identical queries, e.g. when comparing an item with itself, are only listed
+    # once.
+    results = []
+    items_by_query = {}
+    for query_string in query_strings:
+        item_query = _parse_query(query_string)
+        box = get_box(item_query.box)
+        item_query.box = box.box_id
+        query_key = str(item_query)
+        if query_key not in items_by_query:
+            items_by_query[query_key] = box.storage.list_items(item_query)
+        results.append(items_by_query[query_key])
+    return results
+
+
+def _diff_output_is_empty(args, first_file_path, second_file_path):
+    # The default diff doesn't print anything for identical files, so we can
+    # avoid starting a process. Other commands or arguments might still print.
+    if args.diff != 'diff' or args.diff_args:
+        return False
+    return filecmp.cmp(first_file_path, second_file_path, shallow=False)
+
+
 def _add_export_command(subparsers):
     export_parser = subparsers.add_parser(
         "export", help="Export items to a local file."
@@ -558,11 +635,13 @@ def graph_command(args):
     Args:
         args (argparse.Namespace): The parsed arguments from command line.
     """
+    from boxs.graph import (  # pylint: disable=import-outside-toplevel
+        write_graph_of_refs,
+    )
 
     item_query = _parse_query(args.query)
-    if item_query.box is None:
-        item_query.box = get_config().default_box
     box = get_box(item_query.box)
+    item_query.box = box.box_id
     items = box.storage.list_items(item_query)
     refs = [DataRef.from_item(item) for item in items]
 
@@ -576,35 +655,22 @@ def graph_command(args):
         write_graph_of_refs(writer, refs)
 
 
-def _get_run_from_args(args):
-    box = get_box(args.default_box)
-    storage = box.storage
-    runs = storage.list_runs(box.box_id)
-    specified_run = None
-    for run in runs:
-        if args.run in (run.run_id[: len(args.run)], (run.name or '')[: len(args.run)]):
-            specified_run = run
-            break
+def _get_run_from_args(args, box):
+    runs = box.storage.list_runs(box.box_id)
+    prefix = args.run
+    specified_run = next(
+        (
+            run
+            for run in runs
+            if run.run_id.startswith(prefix) or (run.name or '').startswith(prefix)
+        ),
+        None,
+    )
     if specified_run is None:
         _print_error(f"No run found with run-id or name starting with {args.run}", args)
     return specified_run
 
 
-def _get_item_in_run_from_args(args, run):
-    box = get_box()
-    storage = box.storage
-    items = storage.list_items_in_run(box.box_id, run.run_id)
-
-    item = None
-    for i in items:
-        if args.data in (i.data_id[: len(args.data)], i.name[: len(args.data)]):
-            item = i
-            break
-    if item is None:
-        _print_error(f"No item found with data-id starting with {args.data}", args)
-    return item
-
-
 def _parse_query(string):
     try:
         data_ref = DataRef.from_uri(string)
@@ -622,11 +688,14 @@ def _print_result(title, result, args):
         _print_human_readable_result(result)
 
 
+_MAPPING = collections.abc.Mapping
+
+
 def _print_human_readable_result(result):
     if result:
-        if isinstance(result, collections.abc.Mapping):
+        if hasattr(result, 'items'):
             _print_human_readable_mapping(result)
-        elif isinstance(result, collections.abc.Sequence):
+        elif hasattr(result, '__getitem__'):
             _print_human_readable_list(result)
         return
     print("No result")
@@ -634,38 +703,45 @@ def _print_human_readable_result(result):
 
 def _print_human_readable_list(result):
     headers = result[0]._fields
-    field_lengths = [
-        max(max(len(str(x)) for x in item), len(headers[i]))
-        for i, item in enumerate(zip(*result))
-    ]
-    size = shutil.get_terminal_size((80, 20))
-    columns = size.columns
+    field_lengths = [len(header) for header in headers]
+    rows = []
+    for item in result:
+        row = ['' if value is None else str(value) for value in item]
+        for i, string in enumerate(row):
+            if len(string) > field_lengths[i]:
+                field_lengths[i] = len(string)
+        rows.append(row)
+    columns = _terminal_columns()
     if columns < sum(field_lengths) - len(field_lengths):
         missing_columns = sum(field_lengths) + len(field_lengths) - columns
         shorten_per_columns = math.ceil(missing_columns / len(field_lengths))
         field_lengths = [length - shorten_per_columns for length in field_lengths]
-    for i, field in enumerate(headers):
-        print(f'|{field:^{field_lengths[i]}}', end='')
-    print('|')
-    for item in result:
-        for i, field in enumerate(headers):
-            max_length = field_lengths[i]
-            if item[i] is not None:
-                value = _shorten_string(str(item[i]), max_length)
-            else:
-                value = ''
-            print(f' {value:<{max_length}}', end='')
-        print()
+    header_format = ''.join(f'|{{:^{length}}}' for length in field_lengths) + '|\n'
+    row_format = ''.join(f' {{:<{length}}}' for length in field_lengths) + '\n'
+    sys.stdout.write(header_format.format(*headers))
+    for row in rows:
+        sys.stdout.write(
+            row_format.format(
+                *(
+                    _shorten_string(string, length)
+                    for string, length in zip(row, field_lengths)
+                )
+            )
+        )
+
 
+def _print_human_readable_mapping(result):
+    output = io.StringIO()
+    _write_human_readable_mapping(output, result, indent=0, columns=_terminal_columns())
+    sys.stdout.write(output.getvalue())
 
-def _print_human_readable_mapping(result, indent=0):
+
+def _write_human_readable_mapping(output, result, indent, columns):
     headers = ["Property", "Value"]
     field_lengths = [
         max(max(len(str(x)) for x in result.keys()), len(headers[0])),
         max(max(len(str(x)) for x in result.values()), len(headers[0])),
     ]
-    size = shutil.get_terminal_size((80, 20))
-    columns = size.columns
     if columns < sum(field_lengths) - 3 - indent:
         missing_columns = sum(field_lengths) + 3 + indent - columns
         field_lengths = [
@@ -675,50 +751,49 @@ def _print_human_readable_mapping(result, indent=0):
     indent_string = ' ' * indent
     if indent == 0:
         for i, field in enumerate(headers):
-            print(f' {indent_string}{field:<{field_lengths[i]}} ', end='')
-        print()
+            output.write(f' {indent_string}{field:<{field_lengths[i]}} ')
+        output.write('\n')
     max_length_key = field_lengths[0]
     max_length_value = field_lengths[1]
     for key, value in result.items():
-        if value and isinstance(value, collections.abc.Mapping):
-            print(f'{indent_string} {key:<{max_length_key}}:')
-            _print_human_readable_mapping(value, field_lengths[0] + 2)
+        if value and isinstance(value, _MAPPING):
+            output.write(f'{indent_string} {key:<{max_length_key}}:\n')
+            _write_human_readable_mapping(output, value, field_lengths[0] + 2, columns)
         else:
             value = _shorten_string(str(value), max_length_value)
-            print(
-                f'{indent_string} {key:<{max_length_key}}: {value:<{max_length_value}}',
-                end='',
+            output.write(
+                f'{indent_string} {key:<{max_length_key}}: '
+                f'{value:<{max_length_value}}\n'
             )
-            print()
 
 
 def _print_result_as_json(result):
-    if not isinstance(result, dict):
-        result = [item._asdict() for item in result]
-    json.dump(
-        result,
-        sys.stdout,
-        cls=_DatetimeJSONEncoder,
-        allow_nan=False,
-        indent=2,
-        separators=(', ', ': '),
-        sort_keys=True,
-    )
+    encoder = _JSON_ENCODER_PRETTY
+    if isinstance(result, dict):
+        for chunk in encoder.iterencode(result):
+            sys.stdout.write(chunk)
+        return
+
+    # Encode the items one by one instead of converting the whole result first.
+    # JSON escapes line breaks within strings, so indenting every line break
+    # nests an item exactly like encoding the complete list would.
+    separator = '['
+    for item in result:
+        sys.stdout.write(separator + '\n  ')
+        for chunk in encoder.iterencode(item._asdict()):
+            sys.stdout.write(chunk.replace('\n', '\n  '))
+        separator = ', '
+    if separator == '[':
+        sys.stdout.write('[]')
+    else:
+        sys.stdout.write('\n]')
 
 
 def _print_error(error, args):
     logger.error(error)
     if args.json:
         result = {"error": error}
-        json.dump(
-            result,
-            sys.stderr,
-            cls=_DatetimeJSONEncoder,
-            allow_nan=False,
-            indent=None,
-            separators=(',', ':'),
-            sort_keys=True,
-        )
+        sys.stderr.write(_JSON_ENCODER_COMPACT.encode(result))
     else:
         print(f"Error: {error}", file=sys.stderr)
 
@@ -730,20 +805,49 @@ def _confirm(confirmation_message):
     return False
 
 
+def _datetime_to_json(value):
+    return value.isoformat(timespec='milliseconds')
+
+
 class _DatetimeJSONEncoder(json.JSONEncoder):
+    _SERIALIZERS_BY_TYPE = {
+        datetime.datetime: _datetime_to_json,
+    }
+
     def __init__(self, value_serializers=(), **kwargs):
         self.value_serializers = value_serializers
         super().__init__(**kwargs)
 
     def default(self, o):
+        serializer = self._SERIALIZERS_BY_TYPE.get(type(o))
+        if serializer is not None:
+            return serializer(o)
         if isinstance(o, datetime.datetime):
-            return o.isoformat(timespec='milliseconds')
+            return _datetime_to_json(o)
         if isinstance(o, Exception):
-            return o.__class__.__name__ + ': ' + str(o)
+            return f"{type(o).__name__}: {o}"
         # Let the base class default method raise the TypeError
         return json.JSONEncoder.default(self, o)
 
 
+@functools.lru_cache(maxsize=1)
+def _terminal_columns():
+    return shutil.get_terminal_size((80, 20)).columns
+
+
+_JSON_ENCODER_PRETTY = _DatetimeJSONEncoder(
+    allow_nan=False,
+    indent=2,
+    separators=(', ', ': '),
+    sort_keys=True,
+)
+_JSON_ENCODER_COMPACT = _DatetimeJSONEncoder(
+    allow_nan=False,
+    separators=(',', ':'),
+    sort_keys=True,
+)
+
+
 def _shorten_string(string, max_length):
     max_length = max(max_length, 3)
     if len(string) > max_length:
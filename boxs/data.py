@@ -7,6 +7,9 @@ from .api import info, load
 class DataRef:
     """
     Reference to a DataInfo.
+
+    The ids of a DataRef must not be changed, because its URI and hash are only
+    calculated once.
     """
 
     __slots__ = [
@@ -14,6 +17,8 @@ class DataRef:
         'data_id',
         'run_id',
         '_info',
+        '_uri',
+        '_hash',
     ]
 
     def __init__(self, box_id, data_id, run_id):
@@ -21,6 +26,8 @@ class DataRef:
         self.data_id = data_id
         self.run_id = run_id
         self._info = None
+        self._uri = None
+        self._hash = None
 
     def value_info(self):
         """
@@ -59,7 +66,9 @@ class DataRef:
     @property
     def uri(self):
         """Return the URI of the data item referenced."""
-        return f'boxs://{self.box_id}/{self.data_id}/{self.run_id}'
+        if self._uri is None:
+            self._uri = f'boxs://{self.box_id}/{self.data_id}/{self.run_id}'
+        return self._uri
 
     @classmethod
     def from_uri(cls, uri):
@@ -75,11 +84,7 @@ class DataRef:
         Raises:
             ValueError: If the URI doesn't follow the expected format.
         """
-        url_parts = urllib.parse.urlparse(uri)
-        if url_parts.scheme != 'boxs':
-            raise ValueError("Invalid scheme")
-        box_id = url_parts.hostname
-        data_id, run_id = url_parts.path[1:].split('/', 1)
+        box_id, data_id, run_id = _split_uri(uri)
         data = DataRef(box_id, data_id, run_id)
         return data
 
@@ -138,12 +143,36 @@ class DataRef:
         )
 
     def __hash__(self):
-        return hash((self.box_id, self.data_id, self.run_id))
+        if self._hash is None:
+            self._hash = hash((self.box_id, self.data_id, self.run_id))
+        return self._hash
 
     def __str__(self):
         return self.uri
 
 
+_URI_PREFIX = 'boxs://'
+_SPECIAL_URI_CHARACTERS = frozenset('?#;@:[]%\t\n\r')
+
+
+def _split_uri(uri):
+    # URIs created by DataRef.uri contain no special characters, so we can split
+    # them directly instead of parsing them with urllib.
+    if uri.startswith(_URI_PREFIX) and _SPECIAL_URI_CHARACTERS.isdisjoint(uri[7:]):
+        box_id, _, path = uri[7:].partition('/')
+        data_id, separator, run_id = path.partition('/')
+        if not separator:
+            raise ValueError("Missing run id")
+        return box_id.lower() or None, data_id, run_id
+
+    url_parts = urllib.parse.urlparse(uri)
+    if url_parts.scheme != 'boxs':
+        raise ValueError("Invalid scheme")
+    box_id = url_parts.hostname
+    data_id, run_id = url_parts.path[1:].split('/', 1)
+    return box_id, data_id, run_id
+
+
 class DataInfo:
     """
     Class representing a stored data item.
@@ -239,14 +268,28 @@ class DataInfo:
         Returns:
             Dict[str,str]: A dict containing information about this reference.
         """
-        value_info = {
-            'ref': self.ref.value_info(),
-            'origin': self.origin,
-            'name': self.name,
-            'tags': self.tags,
-            'parents': [parent.value_info() for parent in self.parents],
-            'meta': self.meta,
-        }
+        return self._value_info({})
+
+    def _value_info(self, value_infos_by_ref):
+        # Parents that are shared by several items are only converted once.
+        value_info = value_infos_by_ref.get(self.ref)
+        if value_info is None:
+            value_info = {
+                'ref': self.ref.value_info(),
+                'origin': self.origin,
+                'name': self.name,
+                'tags': self.tags,
+                'parents': [
+                    parent._value_info(  # pylint: disable=protected-access
+                        value_infos_by_ref
+                    )
+                    if isinstance(parent, DataInfo)
+                    else parent.value_info()
+                    for parent in self.parents
+                ],
+                'meta': self.meta,
+            }
+            value_infos_by_ref[self.ref] = value_info
         return value_info
 
     @classmethod
@@ -263,19 +306,28 @@ class DataInfo:
         Raises:
             KeyError: If necessary attributes are missing from the `value_info`.
         """
+        return DataInfo._from_value_info(value_info, {})
+
+    @classmethod
+    def _from_value_info(cls, value_info, data_infos_by_ref):
         if 'ref' not in value_info:
             return DataRef.from_value_info(value_info)
 
+        # Parents that are shared by several items are only created once.
         data_ref = DataRef.from_value_info(value_info['ref'])
+        data_info = data_infos_by_ref.get(data_ref)
+        if data_info is not None:
+            return data_info
+
         origin = value_info['origin']
         name = value_info['name']
         tags = value_info['tags']
         meta = value_info['meta']
         parents = tuple(
-            DataInfo.from_value_info(parent_info)
+            DataInfo._from_value_info(parent_info, data_infos_by_ref)
             for parent_info in value_info['parents']
         )
-        return DataInfo(
+        data_info = DataInfo(
             data_ref,
             origin,
             parents,
@@ -283,6 +335,8 @@ class DataInfo:
             tags=tags,
             meta=meta,
         )
+        data_infos_by_ref[data_ref] = data_info
+        return data_info
 
     def __str__(self):
         return self.uri
@@ -1,9 +1,11 @@
 """Store data in a local filesystem"""
 import datetime
+import heapq
 import io
 import logging
 import json
-import os.path
+import operator
+import os
 import pathlib
 import shutil
 
@@ -13,6 +15,14 @@ from .storage import Storage, Reader, Writer, Run, Item
 
 logger = logging.getLogger(__name__)
 
+_BY_TIME = operator.attrgetter('time')
+_FROM_TIMESTAMP = datetime.datetime.fromtimestamp
+_UTC = datetime.timezone.utc
+
+# Data is usually streamed in many small chunks, e.g. by text wrappers, so a
+# larger buffer reduces the number of system calls.
+_STREAM_BUFFER_SIZE = 256 * 1024
+
 
 class FileSystemStorage(Storage):
     """Storage implementation that stores data items and meta-data in a directory."""
@@ -26,24 +36,37 @@ class FileSystemStorage(Storage):
                 data will be stored.
         """
         self.root_directory = pathlib.Path(directory)
+        # The runs directories of the boxes are only created once per instance.
+        self._runs_directory_paths = {}
+        self._runs_names_directory_paths = {}
 
     def _data_file_paths(self, item):
-        base_path = (
-            self.root_directory / item.box_id / 'data' / item.data_id / item.run_id
+        base_path = os.path.join(
+            self.root_directory,
+            item.box_id,
+            'data',
+            item.data_id,
+            _remove_suffix(item.run_id),
         )
-        return base_path.with_suffix('.data'), base_path.with_suffix('.info')
+        return pathlib.Path(base_path + '.data'), pathlib.Path(base_path + '.info')
 
     def _run_file_path(self, item):
         return self._runs_directory_path(item.box_id) / item.run_id / item.data_id
 
     def _runs_directory_path(self, box_id):
-        path = self.root_directory / box_id / 'runs'
-        path.mkdir(parents=True, exist_ok=True)
+        path = self._runs_directory_paths.get(box_id)
+        if path is None:
+            path = self.root_directory / box_id / 'runs'
+            path.mkdir(parents=True, exist_ok=True)
+            self._runs_directory_paths[box_id] = path
         return path
 
     def _runs_names_directory_path(self, box_id):
-        path = self._runs_directory_path(box_id) / '_named'
-        path.mkdir(parents=True, exist_ok=True)
+        path = self._runs_names_directory_paths.get(box_id)
+        if path is None:
+            path = self._runs_directory_path(box_id) / '_named'
+            path.mkdir(parents=True, exist_ok=True)
+            self._runs_names_directory_paths[box_id] = path
         return path
 
     def _run_directory_path(self, box_id, run_id):
@@ -59,20 +82,21 @@ class FileSystemStorage(Storage):
             raise BoxNotFound(box_id)
 
         runs = self._list_runs_in_box(box_id)
-        runs = sorted(runs, key=lambda x: x.time, reverse=True)
         if name_filter is not None:
-            runs = list(filter(lambda x: (x.name or '').startswith(name_filter), runs))
+            runs = [run for run in runs if (run.name or '').startswith(name_filter)]
         if limit is not None:
-            runs = runs[:limit]
-        return runs
+            return heapq.nlargest(limit, runs, key=_BY_TIME)
+        return sorted(runs, key=_BY_TIME, reverse=True)
 
     def _list_runs_in_box(self, box_id):
         runs_directory = self._runs_directory_path(box_id)
-        runs = [
-            self._create_run_from_run_path(box_id, path)
-            for path in runs_directory.iterdir()
-            if path.is_dir() and path != self._runs_names_directory_path(box_id)
-        ]
+        run_names = self._get_run_names(box_id)
+        with os.scandir(runs_directory) as entries:
+            runs = [
+                self._create_run_from_run_path(box_id, entry, run_names)
+                for entry in entries
+                if entry.is_dir() and entry.name != '_named'
+            ]
         return runs
 
     def list_items(self, item_query):
@@ -84,27 +108,21 @@ class FileSystemStorage(Storage):
         logger.debug("List items with query %s", item_query)
 
         runs = self._list_runs_in_box(box_id)
-        if item_query.run:
+        run_prefix = item_query.run
+        if run_prefix:
             runs = [
                 run
                 for run in runs
-                if run.run_id.startswith(item_query.run or '')
-                or (run.name or '').startswith(item_query.run or '')
+                if run.run_id.startswith(run_prefix)
+                or (run.name or '').startswith(run_prefix)
             ]
-        runs = sorted(runs, key=lambda x: x.time)
+        runs = sorted(runs, key=_BY_TIME)
 
+        data_prefix = item_query.data
         all_items = []
         for run in runs:
-            items = self._get_items_in_run(box_id, run.run_id)
-            items = sorted(items, key=lambda x: x.time)
-            all_items.extend(
-                (
-                    item
-                    for item in items
-                    if item.data_id.startswith(item_query.data or '')
-                    or (item.name or '').startswith(item_query.data or '')
-                )
-            )
+            items = self._get_items_in_run(box_id, run.run_id, data_prefix)
+            all_items.extend(sorted(items, key=_BY_TIME))
         return all_items
 
     def set_run_name(self, box_id, run_id, name):
@@ -118,14 +136,15 @@ class FileSystemStorage(Storage):
         if not run_directory.exists():
             raise RunNotFound(box_id, run_id)
 
-        run_path = self._run_directory_path(box_id, run_id)
+        run_path = run_directory
 
-        self._remove_name_for_run(box_id, run_id)
+        run_names = self._remove_name_for_run(box_id, run_id)
 
         if name is not None:
             self._set_name_for_run_path(box_id, name, run_path)
+            run_names[run_id] = name
 
-        run = self._create_run_from_run_path(box_id, run_path)
+        run = self._create_run_from_run_path(box_id, run_path, run_names)
         return run
 
     def delete_run(self, box_id, run_id):
@@ -155,11 +174,16 @@ class FileSystemStorage(Storage):
     def _get_run_names(self, box_id):
         name_directory = self._runs_names_directory_path(box_id)
         run_names = {}
-        for named_link_file in name_directory.iterdir():
-            name = named_link_file.name
-            resolved_run_dir = named_link_file.resolve()
-            run_id = resolved_run_dir.name
-            run_names[run_id] = name
+        try:
+            entries = os.scandir(name_directory)
+        except FileNotFoundError:
+            # The runs directory was removed since we created it, so there are no
+            # names.
+            return run_names
+        with entries:
+            for entry in entries:
+                run_id = os.path.basename(os.readlink(entry.path))
+                run_names[run_id] = entry.name
         return run_names
 
     def _set_name_for_run_path(self, box_id, name, run_path):
@@ -173,53 +197,68 @@ class FileSystemStorage(Storage):
         run_names = self._get_run_names(box_id)
         if run_id in run_names:
             name_dir = self._runs_names_directory_path(box_id)
-            name_symlink_file = name_dir / run_names[run_id]
+            name_symlink_file = name_dir / run_names.pop(run_id)
             name_symlink_file.unlink()
+        return run_names
 
-    def _get_items_in_run(self, box_id, run_id):
+    def _get_items_in_run(self, box_id, run_id, data_prefix=None):
+        # Entries are filtered by their data id and name before creating the items,
+        # so we don't need to stat the files that are filtered out anyway.
         named_items = self._get_item_names_in_run(box_id, run_id)
-        items = [
-            Item(
-                box_id,
-                path.name,
-                run_id,
-                named_items.get(path.name, ''),
-                datetime.datetime.fromtimestamp(
-                    path.stat().st_mtime,
-                    tz=datetime.timezone.utc,
-                ),
-            )
-            for path in self._run_directory_path(box_id, run_id).iterdir()
-            if path.is_file()
-        ]
+        with os.scandir(self._run_directory_path(box_id, run_id)) as entries:
+            items = [
+                Item(
+                    box_id,
+                    entry.name,
+                    run_id,
+                    named_items.get(entry.name, ''),
+                    _FROM_TIMESTAMP(entry.stat().st_mtime, _UTC),
+                )
+                for entry in entries
+                if entry.is_file()
+                and (
+                    not data_prefix
+                    or entry.name.startswith(data_prefix)
+                    or named_items.get(entry.name, '').startswith(data_prefix)
+                )
+            ]
         return items
 
     def _get_item_names_in_run(self, box_id, run_id):
         name_directory = self._run_directory_path(box_id, run_id) / '_named'
         named_items = {}
         if name_directory.exists():
-            for named_link_file in name_directory.iterdir():
-                name = named_link_file.name
-                resolved_info_file = named_link_file.resolve()
-                data_id = resolved_info_file.name
-                named_items[data_id] = name
+            with os.scandir(name_directory) as entries:
+                for entry in entries:
+                    data_id = os.path.basename(os.readlink(entry.path))
+                    named_items[data_id] = entry.name
         return named_items
 
-    def _create_run_from_run_path(self, box_id, run_path):
-        run_names = self._get_run_names(box_id)
+    def _create_run_from_run_path(self, box_id, run_path, run_names=None):
+        # run_path can also be an os.DirEntry, which caches its stat result.
+        if run_names is None:
+            run_names = self._get_run_names(box_id)
         run_id = run_path.name
         return Run(
             box_id,
             run_id,
             run_names.get(run_id),
-            datetime.datetime.fromtimestamp(
-                run_path.stat().st_mtime,
-                tz=datetime.timezone.utc,
-            ),
+            _FROM_TIMESTAMP(run_path.stat().st_mtime, _UTC),
         )
 
 
+def _remove_suffix(name):
+    # Data files were named using Path.with_suffix(), which replaces anything that
+    # looks like a suffix in the run id, so we have to keep doing the same.
+    index = name.rfind('.')
+    if 0 < index < len(name) - 1:
+        return name[:index]
+    return name
+
+
 class _FileSystemReader(Reader):
+    __slots__ = ('data_file', 'info_file', '_info')
+
     def __init__(self, item, data_file, info_file):
         super().__init__(item)
         self.data_file = data_file
@@ -228,16 +267,21 @@ class _FileSystemReader(Reader):
 
     @property
     def info(self):
-        if not self.info_file.exists():
-            raise DataNotFound(self.item.box_id, self.item.data_id, self.item.run_id)
         if self._info is None:
-            self._info = json.loads(self.info_file.read_text())
+            try:
+                with io.FileIO(self.info_file, 'r') as info_stream:
+                    info_data = info_stream.readall()
+            except FileNotFoundError as error:
+                raise DataNotFound(
+                    self.item.box_id, self.item.data_id, self.item.run_id
+                ) from error
+            self._info = json.loads(info_data.decode('utf-8'))
         return self._info
 
     def as_stream(self):
         if not self.data_file.exists():
             raise DataNotFound(self.item.box_id, self.item.data_id, self.item.run_id)
-        return io.FileIO(self.data_file, 'r')
+        return open(self.data_file, 'rb', buffering=_STREAM_BUFFER_SIZE)
 
     def as_file(self):
         """
@@ -253,6 +297,8 @@ class _FileSystemReader(Reader):
 
 
 class _FileSystemWriter(Writer):
+    __slots__ = ('data_file', 'info_file', 'run_file')
+
     def __init__(  # pylint: disable=too-many-arguments
         self, item, name, tags, data_file, info_file, run_file
     ):
@@ -263,18 +309,28 @@ class _FileSystemWriter(Writer):
 
     def as_stream(self):
         self.data_file.parent.mkdir(parents=True, exist_ok=True)
-        if self.data_file.exists():
-            raise DataCollision(self.item.box_id, self.item.data_id, self.item.run_id)
-        return io.FileIO(self.data_file, 'w')
+        try:
+            return open(self.data_file, 'xb', buffering=_STREAM_BUFFER_SIZE)
+        except FileExistsError as error:
+            raise DataCollision(
+                self.item.box_id, self.item.data_id, self.item.run_id
+            ) from error
 
     def write_info(self, info):
         self.info_file.parent.mkdir(parents=True, exist_ok=True)
-        if self.info_file.exists():
-            raise DataCollision(self.item.box_id, self.item.data_id, self.item.run_id)
-        self.info_file.write_text(json.dumps(info))
+        try:
+            with self.info_file.open('xb') as info_stream:
+                info_stream.write(
+                    json.dumps(info, separators=(',', ':')).encode('utf-8')
+                )
+        except FileExistsError as error:
+            raise DataCollision(
+                self.item.box_id, self.item.data_id, self.item.run_id
+            ) from error
         run_dir = self.run_file.parent
         run_dir.mkdir(parents=True, exist_ok=True)
-        self.run_file.touch()
+        # The run file only marks the item as part of the run, it is never written.
+        os.close(os.open(self.run_file, os.O_WRONLY | os.O_CREAT, 0o666))
         if self.name:
             name_dir = run_dir / '_named'
             name_dir.mkdir(exist_ok=True)
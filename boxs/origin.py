@@ -1,6 +1,7 @@
 """Origins of data"""
 import inspect
 import json
+import sys
 import typing
 
 
@@ -17,9 +18,7 @@ class OriginContext:
     """
 
     def __init__(self, name, tags, level=2):
-        frame = inspect.currentframe()
-        for _ in range(level):
-            frame = frame.f_back
+        frame = sys._getframe(level)  # pylint: disable=protected-access
         self.function_name = frame.f_code.co_name
         self.arg_info = inspect.getargvalues(frame)
         self.name = name
@@ -120,6 +119,9 @@ OriginMappingFunction that uses the name as origin.
 """
 
 
+_TAGS_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+
+
 class _OriginFromTags:
     def __call__(self, context):
         """
@@ -131,7 +133,7 @@ class _OriginFromTags:
         Returns:
             str: The origin as JSON string.
         """
-        return json.dumps(context.tags, sort_keys=True, separators=(',', ':'))
+        return _TAGS_ENCODER.encode(context.tags)
 
     def __repr__(self):
         return 'ORIGIN_FROM_TAGS'
@@ -6,6 +6,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_WRITE_BUFFER_SIZE = 256 * 1024
+
+
+def _buffered_stream(stream):
+    # Raw streams, e.g. from transformers, would otherwise receive every small
+    # chunk that the text wrapper flushes.
+    if isinstance(stream, io.BufferedIOBase):
+        return stream
+    return io.BufferedWriter(stream, buffer_size=_WRITE_BUFFER_SIZE)
+
 
 try:
     import pandas
@@ -22,7 +32,7 @@ try:
 
         def write_value_to_writer(self, value, writer):
             with writer.as_stream() as stream, io.TextIOWrapper(
-                stream, encoding=self._default_encoding
+                _buffered_stream(stream), encoding=self._default_encoding
             ) as text_writer:
                 value.to_csv(text_writer)
             writer.meta['encoding'] = self._default_encoding
@@ -36,8 +46,47 @@ try:
                 return result
 
 except ImportError as error:
+    pandas = None
     logger.warning(
         "Unable to load pandas package %s, pandas specific "
         "value types are not available.",
         error,
     )
+
+
+if pandas is not None:
+    from .value_types import ValueType
+
+    class PandasDataFrameParquetValueType(ValueType):
+        """
+        A value type for storing and loading pandas DataFrame in parquet format.
+
+        Parquet stores the columns in binary form, which is usually smaller and faster
+        to read and write than CSV. It requires a parquet engine like `pyarrow` to be
+        installed. The value type uses 'zstd' compression by default, `None` disables
+        the compression.
+        """
+
+        def __init__(self, default_compression='zstd'):
+            self._default_compression = default_compression
+            super().__init__()
+
+        def supports(self, value):
+            return isinstance(value, pandas.DataFrame)
+
+        def write_value_to_writer(self, value, writer):
+            with writer.as_stream() as stream:
+                value.to_parquet(stream, compression=self._default_compression)
+
+        def read_value_from_reader(self, reader):
+            # Parquet files are read starting from their footer, so we need random
+            # access, which the streams from transformers don't provide.
+            with reader.as_stream() as stream:
+                return pandas.read_parquet(io.BytesIO(stream.read()))
+
+        def _get_parameter_string(self):
+            return self._default_compression or ''
+
+        @classmethod
+        def _from_parameter_string(cls, parameters):
+            return cls(default_compression=parameters or None)
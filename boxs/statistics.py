@@ -45,10 +45,16 @@ class _CountingStreamWrapper(DelegatingStream):
 
     def write(self, byte_buffer):
         written = super().write(byte_buffer)
+        if not isinstance(byte_buffer, (bytes, bytearray)):
+            # Buffered writers pass memoryviews of their buffer, which can't count.
+            byte_buffer = memoryview(byte_buffer).tobytes()
         self._bytes_written += written
-        self._linebreaks += byte_buffer.count(ord('\n'))
+        self._linebreaks += byte_buffer.count(b'\n', 0, written)
+        return written
 
 
 class _StatisticsWriter(DelegatingWriter):
+    __slots__ = ()
+
     def as_stream(self):
         return _CountingStreamWrapper(self.delegate.as_stream(), self.delegate.meta)
@@ -72,17 +72,13 @@ class ItemQuery:
     """
 
     def __init__(self, string):
-        parts = list(reversed(string.strip().rsplit(':')))
-        self.run = parts[0] or None
-        if len(parts) > 1:
-            self.data = parts[1] or None
-        else:
-            self.data = None
-        if len(parts) > 2:
-            self.box = parts[2] or None
-        else:
-            self.box = None
-        if len(parts) > 3:
+        remainder, _, run = string.strip().rpartition(':')
+        remainder, _, data = remainder.rpartition(':')
+        _, separator, box = remainder.rpartition(':')
+        self.run = run or None
+        self.data = data or None
+        self.box = box or None
+        if separator:
             raise ValueError("Invalid query, must be in format '<box>:<data>:<run>'.")
         if self.run is None and self.data is None and self.box is None:
             raise ValueError("Neither, box, data or run is specified.")
@@ -106,7 +102,7 @@ class ItemQuery:
         return ItemQuery(':'.join([box or '', data or '', run or '']))
 
     def __str__(self):
-        return ':'.join([self.box or '', self.data or '', self.run or ''])
+        return f"{self.box or ''}:{self.data or ''}:{self.run or ''}"
 
 
 class Storage(abc.ABC):
@@ -220,6 +216,8 @@ class Reader(abc.ABC):
     Base class for the storage specific reader implementations.
     """
 
+    __slots__ = ('_item',)
+
     def __init__(self, item):
         """
         Creates a `Reader` instance, that allows to load existing data.
@@ -264,7 +262,7 @@ class Reader(abc.ABC):
         Return a stream from which the data content can be read.
 
         Returns:
-            io.RawIOBase: A stream instance from which the data can be read.
+            io.IOBase: A binary stream instance from which the data can be read.
         """
 
 
@@ -273,6 +271,8 @@ class Writer(abc.ABC):
     Base class for the storage specific writer implementations.
     """
 
+    __slots__ = ('_item', '_name', '_tags', '_meta')
+
     def __init__(self, item, name, tags):
         """
         Creates a `Writer` instance, that allows to store new data.
@@ -342,7 +342,7 @@ class Writer(abc.ABC):
         This method can be used by the ValueType to actually transfer the data.
 
         Returns:
-            io.RawIOBase: The binary io-stream.
+            io.IOBase: The binary io-stream.
 
         Raises:
             boxs.errors.DataCollision: If a data item with the same ids already
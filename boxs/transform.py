@@ -13,6 +13,8 @@ class Transformer:
     implementing encryption.
     """
 
+    __slots__ = ()
+
     def transform_writer(self, writer):
         """
         Transform a given writer.
@@ -45,6 +47,8 @@ class DelegatingReader(Reader):
     Reader class that delegates all calls to a wrapped reader.
     """
 
+    __slots__ = ('delegate',)
+
     def __init__(self, delegate):
         """
         Create a new DelegatingReader.
@@ -76,6 +80,8 @@ class DelegatingWriter(Writer):
     Writer that delegates all call to a wrapped writer.
     """
 
+    __slots__ = ('delegate',)
+
     def __init__(self, delegate):
         self.delegate = delegate
         super().__init__(delegate.item, delegate.name, delegate.tags)
@@ -1,13 +1,13 @@
 """Types for reading and writing of different value types"""
 import abc
+import functools
 import importlib
 import io
 import json
 import logging
+import os
 import pathlib
 import shutil
-import tempfile
-import zipfile
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +18,8 @@ class ValueType(abc.ABC):
     and from Readers and Writers.
     """
 
+    _specification = None
+
     def __init__(self):
         self._logger = logging.getLogger(str(self.__class__))
 
@@ -72,14 +74,19 @@ class ValueType(abc.ABC):
         """
         Returns a string that specifies this ValueType.
 
+        The specification is only determined once, so the parameters of a ValueType
+        must not change after it was first requested.
+
         Returns:
             str: The specification that can be used for recreating this specific
                 ValueType.
         """
-        module_name = self.__class__.__module__
-        class_name = self.__class__.__qualname__
-        parameter_string = self._get_parameter_string()
-        return ':'.join([module_name, class_name, parameter_string])
+        if self._specification is None:
+            module_name = self.__class__.__module__
+            class_name = self.__class__.__qualname__
+            parameter_string = self._get_parameter_string()
+            self._specification = ':'.join([module_name, class_name, parameter_string])
+        return self._specification
 
     @classmethod
     def from_specification(cls, specification):
@@ -96,8 +103,7 @@ class ValueType(abc.ABC):
         """
         logger.debug("Recreating value type from specification %s", specification)
         module_name, class_name, parameter_string = specification.split(':', maxsplit=2)
-        module = importlib.import_module(module_name)
-        class_ = getattr(module, class_name)
+        class_ = _get_value_type_class(module_name, class_name)
         value_type = class_._from_parameter_string(  # pylint: disable=protected-access
             parameter_string,
         )
@@ -133,6 +139,45 @@ class ValueType(abc.ABC):
         return self.get_specification()
 
 
+@functools.lru_cache(maxsize=256)
+def _get_value_type_class(module_name, class_name):
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+# Copying in bigger chunks than shutil's default of 64 KiB reduces the number of
+# reads and writes on large values.
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+_SENDFILE_BLOCK_SIZE = 8 * 1024 * 1024
+
+
+def _copy_stream(source_stream, destination_stream):
+    # Streams of transformers don't expose a file descriptor, so those still see
+    # all the data, while plain files are copied by the kernel if possible.
+    try:
+        source_fd = source_stream.fileno()
+        destination_fd = destination_stream.fileno()
+    except (AttributeError, OSError):
+        shutil.copyfileobj(source_stream, destination_stream, _COPY_BUFFER_SIZE)
+        return
+    start = offset = source_stream.tell()
+    destination_stream.flush()
+    while True:
+        try:
+            sent = os.sendfile(destination_fd, source_fd, offset, _SENDFILE_BLOCK_SIZE)
+        except (AttributeError, OSError):
+            # Not every platform supports sendfile() between files.
+            if offset != start:
+                raise
+            shutil.copyfileobj(source_stream, destination_stream, _COPY_BUFFER_SIZE)
+            return
+        if sent == 0:
+            return
+        offset += sent
+
+
 class BytesValueType(ValueType):
     """
     A ValueType for reading and writing bytes/bytearray values.
@@ -142,9 +187,8 @@ class BytesValueType(ValueType):
         return isinstance(value, (bytes, bytearray))
 
     def write_value_to_writer(self, value, writer):
-        source_stream = io.BytesIO(value)
         with writer.as_stream() as destination_stream:
-            shutil.copyfileobj(source_stream, destination_stream)
+            destination_stream.write(value)
 
     def read_value_from_reader(self, reader):
         with reader.as_stream() as stream:
@@ -168,6 +212,8 @@ class DirectoryValueType(ValueType):
         return isinstance(value, pathlib.Path) and value.exists() and value.is_dir()
 
     def write_value_to_writer(self, value, writer):
+        import zipfile  # pylint: disable=import-outside-toplevel
+
         def _add_directory(root, directory, _zip_file):
             for path in directory.iterdir():
                 if path.is_file():
@@ -181,6 +227,9 @@ class DirectoryValueType(ValueType):
             _add_directory(value, value, zip_file)
 
     def read_value_from_reader(self, reader):
+        import tempfile  # pylint: disable=import-outside-toplevel
+        import zipfile  # pylint: disable=import-outside-toplevel
+
         dir_path = self._dir_path
         if self._dir_path is None:
             dir_path = tempfile.mkdtemp()
@@ -214,7 +263,7 @@ class FileValueType(ValueType):
 
     def write_value_to_writer(self, value, writer):
         with value.open('rb') as file_reader, writer.as_stream() as destination_stream:
-            shutil.copyfileobj(file_reader, destination_stream)
+            _copy_stream(file_reader, destination_stream)
 
     def read_value_from_reader(self, reader):
         if hasattr(reader, 'as_file'):
@@ -224,16 +273,20 @@ class FileValueType(ValueType):
                 shutil.copyfile(str(reader.as_file()), str(self._file_path))
                 return self._file_path
             return reader.as_file()
-        file_path = self._file_path
-        if self._file_path is None:
-            file_path = tempfile.mktemp()
-        file_path = pathlib.Path(file_path)
-        with reader.as_stream() as read_stream, io.FileIO(
-            file_path, 'w'
-        ) as file_stream:
+        with reader.as_stream() as read_stream, self._open_file() as file_stream:
             self._logger.debug("Writing file from stream")
-            shutil.copyfileobj(read_stream, file_stream)
-        return file_path
+            _copy_stream(read_stream, file_stream)
+        return pathlib.Path(file_stream.name)
+
+    def _open_file(self):
+        if self._file_path is None:
+            import tempfile  # pylint: disable=import-outside-toplevel
+
+            return tempfile.NamedTemporaryFile(delete=False)
+        return open(self._file_path, 'wb')
+
+
+_JSON_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
 
 
 class JsonValueType(ValueType):
@@ -246,10 +299,11 @@ class JsonValueType(ValueType):
 
     def write_value_to_writer(self, value, writer):
         writer.meta['media_type'] = 'application/json'
-        with writer.as_stream() as destination_stream, io.TextIOWrapper(
-            destination_stream
-        ) as text_writer:
-            json.dump(value, text_writer, sort_keys=True, separators=(',', ':'))
+        # Encoding the whole value at once uses the C implementation of the encoder,
+        # which json.dump() doesn't. The output is ASCII, so no encoding is needed.
+        encoded_value = _JSON_ENCODER.encode(value).encode('ascii')
+        with writer.as_stream() as destination_stream:
+            destination_stream.write(encoded_value)
 
     def read_value_from_reader(self, reader):
         with reader.as_stream() as stream:
@@ -266,7 +320,7 @@ class StreamValueType(ValueType):
 
     def write_value_to_writer(self, value, writer):
         with writer.as_stream() as destination_stream:
-            shutil.copyfileobj(value, destination_stream)
+            shutil.copyfileobj(value, destination_stream, _COPY_BUFFER_SIZE)
 
     def read_value_from_reader(self, reader):
         return reader.as_stream()
@@ -288,18 +342,20 @@ class StringValueType(ValueType):
         return isinstance(value, str)
 
     def write_value_to_writer(self, value, writer):
-        source_stream = io.BytesIO(value.encode(self._default_encoding))
+        encoded_value = value.encode(self._default_encoding)
         writer.meta['encoding'] = self._default_encoding
         with writer.as_stream() as destination_stream:
-            shutil.copyfileobj(source_stream, destination_stream)
+            destination_stream.write(encoded_value)
 
     def read_value_from_reader(self, reader):
         encoding = reader.meta.get('encoding', self._default_encoding)
         self._logger.debug("Reading string with encoding %s", encoding)
-        with reader.as_stream() as stream, io.TextIOWrapper(
-            stream, encoding=encoding
-        ) as text_reader:
-            return text_reader.read()
+        with reader.as_stream() as stream:
+            value = stream.read().decode(encoding)
+        # Strings were read with a TextIOWrapper before, which translates newlines.
+        if '\r' in value:
+            value = value.replace('\r\n', '\n').replace('\r', '\n')
+        return value
 
     def _get_parameter_string(self):
         return self._default_encoding
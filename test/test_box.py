@@ -27,6 +27,12 @@ class TestCalculateDataId(unittest.TestCase):
         data_id2 = calculate_data_id(parent_ids=['parent_id2', 'parent_id1'], origin='my.data')
         self.assertEqual(data_id1, data_id2)
 
+    def test_data_id_is_stable_for_repeated_calls(self):
+        data_id1 = calculate_data_id(parent_ids=['parent_id1'], origin='my.data', name='x')
+        data_id2 = calculate_data_id(parent_ids=('parent_id1',), origin='my.data', name='x')
+        self.assertEqual('ab46c520f090a3f7', data_id1)
+        self.assertEqual(data_id1, data_id2)
+
 
 class DummyStorage(Storage):
 
@@ -2,10 +2,12 @@ import io
 import json
 import pathlib
 import shutil
+import sys
 import tempfile
 import time
 import unittest.mock
 
+import boxs.config
 from boxs.box import Box
 from boxs.box_registry import unregister_box
 from boxs.cli import main
@@ -56,6 +58,54 @@ class TestCli(unittest.TestCase):
             main(['-i', 'my_init_module'])
             self.assertEqual('my_init_module', get_config_mock.return_value.init_module)
 
+    def test_main_with_box_in_query_loads_init_module_from_env_variable(self):
+        init_module = self.__module__.rsplit('.', maxsplit=1)[0] + '.box_config'
+        sys.modules.pop(init_module, None)
+        self.addCleanup(sys.modules.pop, init_module, None)
+        self.addCleanup(setattr, boxs.config, '_CONFIG', None)
+        boxs.config._CONFIG = None
+        self.box.store('My value', run_id='run-1')
+        with unittest.mock.patch.dict('os.environ', {'BOXS_INIT_MODULE': init_module}):
+            with unittest.mock.patch('sys.stdout', new=io.StringIO()) as fake_out:
+                main(['list', 'cli-box::'])
+        self.assertIn(init_module, sys.modules)
+        self.assertIn('run-1', fake_out.getvalue())
+
+    def test_main_with_box_named_like_command(self):
+        self.box.store('My value', run_id='run-1')
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()) as fake_out:
+            main(['-b', 'list', 'list-runs'])
+            self.assertIn('List runs', fake_out.getvalue())
+            self.assertIn('run-1', fake_out.getvalue())
+
+    def test_main_with_box_named_like_command_in_combined_options(self):
+        self.box.store('My value', run_id='run-1')
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()) as fake_out:
+            main(['-jb', 'list', 'list-runs'])
+            self.assertIn('run-1', fake_out.getvalue())
+
+    def test_main_with_box_named_like_command_in_abbreviated_option(self):
+        self.box.store('My value', run_id='run-1')
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()) as fake_out:
+            main(['--default', 'list', 'list-runs'])
+            self.assertIn('List runs', fake_out.getvalue())
+            self.assertIn('run-1', fake_out.getvalue())
+
+    def test_main_with_box_named_like_command_in_attached_option(self):
+        self.box.store('My value', run_id='run-1')
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()) as fake_out:
+            main(['--default-box=list', 'list-runs'])
+            self.assertIn('List runs', fake_out.getvalue())
+            self.assertIn('run-1', fake_out.getvalue())
+
+    def test_main_with_unknown_command_shows_all_commands(self):
+        with unittest.mock.patch('sys.stderr', new=io.StringIO()) as fake_err:
+            with self.assertRaisesRegex(SystemExit, "2"):
+                main(['unknown'])
+            self.assertIn("invalid choice: 'unknown'", fake_err.getvalue())
+            self.assertIn('list-runs', fake_err.getvalue())
+            self.assertIn('graph', fake_err.getvalue())
+
     def test_main_list_runs(self):
         self.box.store('My value', run_id='run-1')
         self.box.store('My other', run_id='run-2')
@@ -355,6 +405,21 @@ class TestCli(unittest.TestCase):
             result = json.loads(fake_out.getvalue())
             self.assertEqual(len(result), 2)
 
+    def test_main_list_runs_in_json(self):
+        self.box.store('My value', run_id='run-1')
+        self.box.store('My other', run_id='run-2')
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()) as fake_out:
+            main(['-b', 'cli-box', '-j', 'list-runs'])
+            result = json.loads(fake_out.getvalue())
+            self.assertEqual({'run-1', 'run-2'}, {run['run_id'] for run in result})
+            self.assertTrue(fake_out.getvalue().startswith('[\n  {\n    "box_id": '))
+
+    def test_main_list_runs_in_json_without_runs(self):
+        self.box.store('My value', run_id='run-1')
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()) as fake_out:
+            main(['-b', 'cli-box', '-j', 'list-runs', '-f', 'unknown'])
+            self.assertEqual('[]', fake_out.getvalue())
+
     def test_main_list_items_with_empty_box_prints_error(self):
         with unittest.mock.patch('sys.stderr', new=io.StringIO()) as fake_out:
             main(['-b', 'cli-box', 'list', 'run-1'])
@@ -462,10 +527,32 @@ class TestCli(unittest.TestCase):
         self.assertIn('< My value', stdout_file.read_text())
         self.assertIn('> My other', stdout_file.read_text())
 
+    def test_main_diff_with_identical_data_skips_diff(self):
+        self.box.store('My value', name='my-data', run_id='run-1')
+        self.box.store('My value', name='my-data', run_id='run-2')
+        with unittest.mock.patch('subprocess.run') as run_mock:
+            main(['-b', 'cli-box', 'diff', 'my-data:run-1', 'my-data:run-2'])
+            run_mock.assert_not_called()
+
+    def test_main_diff_with_identical_data_and_diff_arguments_calls_diff(self):
+        self.box.store('My value', name='my-data', run_id='run-1')
+        self.box.store('My value', name='my-data', run_id='run-2')
+        with unittest.mock.patch('subprocess.run') as run_mock:
+            main(['-b', 'cli-box', 'diff', 'my-data:run-1', 'my-data:run-2', '--', '-s'])
+            run_mock.assert_called()
+
+    def test_main_diff_with_same_query_lists_items_once(self):
+        self.box.store('My value', name='my-data', run_id='run-1')
+        with unittest.mock.patch.object(
+            self.box.storage, 'list_items', wraps=self.box.storage.list_items,
+        ) as list_items_mock:
+            main(['-b', 'cli-box', 'diff', 'my-data:run-1', 'my-data:run-1'])
+            list_items_mock.assert_called_once()
+
     def test_main_diff_with_custom_diff(self):
         self.box.store('My value', name='my-data', run_id='run-1')
         self.box.store('My other', name='my-data', run_id='run-2')
-        with unittest.mock.patch('boxs.cli.subprocess.run') as run_mock:
+        with unittest.mock.patch('subprocess.run') as run_mock:
             main(['-b', 'cli-box', 'diff', '--diff-command', 'my-diff', 'my-data:run-1', 'my-data:run-2'])
             run_mock.assert_called()
             self.assertEqual('my-diff', run_mock.call_args[0][0][0])
@@ -473,7 +560,7 @@ class TestCli(unittest.TestCase):
     def test_main_diff_with_additional_diff_arguments(self):
         self.box.store('My value', name='my-data', run_id='run-1')
         self.box.store('My other', name='my-data', run_id='run-2')
-        with unittest.mock.patch('boxs.cli.subprocess.run') as run_mock:
+        with unittest.mock.patch('subprocess.run') as run_mock:
             main(['-b', 'cli-box', 'diff', 'my-data:run-1', 'my-data:run-2', '--', '--my-arg'])
             run_mock.assert_called()
             self.assertEqual('--my-arg', run_mock.call_args[0][0][7])
@@ -481,7 +568,7 @@ class TestCli(unittest.TestCase):
     def test_main_diff_without_labels(self):
         self.box.store('My value', name='my-data', run_id='run-1')
         self.box.store('My other', name='my-data', run_id='run-2')
-        with unittest.mock.patch('boxs.cli.subprocess.run') as run_mock:
+        with unittest.mock.patch('subprocess.run') as run_mock:
             main(['-b', 'cli-box', 'diff', 'my-data:run-1', 'my-data:run-2', '--without-labels'])
             run_mock.assert_called()
             self.assertNotIn('--label', run_mock.call_args[0][0])
@@ -47,6 +47,18 @@ class TestDataRef(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "Invalid scheme"):
             DataRef.from_uri(uri)
 
+    def test_from_uri_raises_if_run_id_is_missing(self):
+        uri = 'boxs://my-storage/data-id'
+        with self.assertRaises(ValueError):
+            DataRef.from_uri(uri)
+
+    def test_from_uri_with_query_ignores_query(self):
+        uri = 'boxs://My-Storage/data-id/run-id?query'
+        data_ref = DataRef.from_uri(uri)
+        self.assertEqual('my-storage', data_ref.box_id)
+        self.assertEqual('data-id', data_ref.data_id)
+        self.assertEqual('run-id', data_ref.run_id)
+
     @unittest.mock.patch('boxs.data.info')
     def test_info_is_loaded_at_first_access_and_cached(self, info_mock):
         data_ref = DataRef('my-box', 'data-id', 'my-revision')
@@ -216,6 +228,30 @@ class TestDataInfo(unittest.TestCase):
         self.assertEqual(data_info.meta, recreated_info.meta)
         self.assertEqual(parent, recreated_info.parents[0])
 
+    def test_value_info_converts_shared_parents_once(self):
+        grand_parent = DataInfo(DataRef('my-storage', 'grand-parent-id', 'revision-id'), 'origin')
+        parents = [
+            DataInfo(DataRef('my-storage', f'parent-{index}', 'revision-id'), 'origin', parents=[grand_parent])
+            for index in range(2)
+        ]
+        data = DataInfo(DataRef('my-storage', 'data-id', 'revision-id'), 'origin', parents=parents)
+        info = data.value_info()
+        self.assertEqual(grand_parent.value_info(), info['parents'][0]['parents'][0])
+        self.assertIs(info['parents'][0]['parents'][0], info['parents'][1]['parents'][0])
+
+    def test_from_value_info_creates_shared_parents_once(self):
+        grand_parent = DataInfo(DataRef('my-storage', 'grand-parent-id', 'revision-id'), 'origin')
+        parents = [
+            DataInfo(DataRef('my-storage', f'parent-{index}', 'revision-id'), 'origin', parents=[grand_parent])
+            for index in range(2)
+        ]
+        data = DataInfo(DataRef('my-storage', 'data-id', 'revision-id'), 'origin', parents=parents)
+        value_info = json.loads(json.dumps(data.value_info()))
+        recreated_info = DataInfo.from_value_info(value_info)
+        recreated_grand_parent = recreated_info.parents[0].parents[0]
+        self.assertEqual(grand_parent.ref, recreated_grand_parent.ref)
+        self.assertIs(recreated_grand_parent, recreated_info.parents[1].parents[0])
+
     def test_str_returns_uri(self):
         data = DataInfo(DataRef('my-storage', 'data-id', 'revision-id'), 'origin')
         uri = data.uri
@@ -0,0 +1,20 @@
+import copy
+import pickle
+import unittest
+
+from boxs.errors import BoxNotDefined
+
+
+class TestErrors(unittest.TestCase):
+
+    def test_error_attributes_survive_pickling(self):
+        error = pickle.loads(pickle.dumps(BoxNotDefined('box-id')))
+        self.assertEqual('box-id', error.box_id)
+
+    def test_error_attributes_survive_copying(self):
+        error = copy.copy(BoxNotDefined('box-id'))
+        self.assertEqual('box-id', error.box_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ import shutil
 import tempfile
 import time
 import unittest
+import unittest.mock
 
 from boxs.errors import BoxNotFound, DataCollision, DataNotFound, NameCollision, RunNotFound
 from boxs.filesystem import FileSystemStorage
@@ -38,6 +39,19 @@ class TestFileSystemStorage(unittest.TestCase):
         self.assertGreater(runs[0].time, runs[1].time)
         self.assertGreater(runs[1].time, runs[2].time)
 
+    def test_list_runs_reads_run_names_once(self):
+        for run_id in ['run1', 'run2', 'run3']:
+            writer = self.storage.create_writer(Item('box-id', 'data-id', run_id))
+            writer.write_info({})
+        self.storage.set_run_name('box-id', 'run2', 'my-run')
+
+        with unittest.mock.patch.object(
+            self.storage, '_get_run_names', wraps=self.storage._get_run_names,
+        ) as get_run_names_mock:
+            runs = self.storage.list_runs('box-id')
+            get_run_names_mock.assert_called_once_with('box-id')
+        self.assertEqual({'my-run', None}, {run.name for run in runs})
+
     def test_listing_runs_for_invalid_box_id_raises(self):
         writer = self.storage.create_writer(Item('box-id', 'data-id', 'run1'))
         writer.write_info({})
@@ -60,6 +74,16 @@ class TestFileSystemStorage(unittest.TestCase):
         self.assertEqual('run3', runs[0].run_id)
         self.assertEqual('run2', runs[1].run_id)
 
+    def test_list_runs_limits_runs_matching_the_name_filter(self):
+        for run_id, name in [('run1', 'my-run1'), ('run2', 'other'), ('run3', 'my-run3')]:
+            writer = self.storage.create_writer(Item('box-id', 'data-id', run_id))
+            writer.write_info({})
+            self.storage.set_run_name('box-id', run_id, name)
+            time.sleep(0.01)
+
+        runs = self.storage.list_runs('box-id', limit=2, name_filter='my-')
+        self.assertEqual(['run3', 'run1'], [run.run_id for run in runs])
+
     def test_delete_run_removes_data_items(self):
         writer = self.storage.create_writer(Item('box-id', 'data-id', 'run1'))
         writer.write_value(b'My data', BytesValueType())
@@ -76,6 +100,56 @@ class TestFileSystemStorage(unittest.TestCase):
         self.assertFalse(data_file.exists())
         self.assertFalse(info_file.exists())
 
+    def test_run_can_be_written_again_after_delete(self):
+        writer = self.storage.create_writer(Item('box-id', 'data-id', 'run1'), name='my-data')
+        writer.write_value(b'My data', BytesValueType())
+        writer.write_info({})
+
+        self.storage.delete_run('box-id', 'run1')
+
+        writer = self.storage.create_writer(Item('box-id', 'data-id', 'run1'), name='my-data')
+        writer.write_value(b'My data', BytesValueType())
+        writer.write_info({})
+        items = self.storage.list_items(ItemQuery('box-id:my-data:run1'))
+        self.assertEqual(1, len(items))
+
+    def test_run_can_be_written_again_after_delete_by_other_storage(self):
+        writer = self.storage.create_writer(Item('box-id', 'data-id', 'run1'), name='my-data')
+        writer.write_value(b'My data', BytesValueType())
+        writer.write_info({})
+
+        FileSystemStorage(self.dir).delete_run('box-id', 'run1')
+
+        writer = self.storage.create_writer(Item('box-id', 'data-id2', 'run1'), name='my-data2')
+        writer.write_value(b'My data', BytesValueType())
+        writer.write_info({})
+        items = self.storage.list_items(ItemQuery('box-id::run1'))
+        self.assertEqual(1, len(items))
+
+    def test_data_can_be_written_after_box_directory_was_removed(self):
+        writer = self.storage.create_writer(Item('box-id', 'data-id', 'run1'), name='my-data')
+        writer.write_value(b'My data', BytesValueType())
+        writer.write_info({})
+
+        self.storage.list_runs('box-id')
+
+        shutil.rmtree(self.dir / 'box-id')
+
+        writer = self.storage.create_writer(Item('box-id', 'data-id', 'run1'), name='my-data')
+        writer.write_value(b'My data', BytesValueType())
+        writer.write_info({})
+        self.assertEqual(1, len(self.storage.list_runs('box-id')))
+        items = self.storage.list_items(ItemQuery('box-id:my-data:run1'))
+        self.assertEqual(1, len(items))
+
+    def test_run_id_with_dot_keeps_data_file_location(self):
+        writer = self.storage.create_writer(Item('box-id', 'data-id', 'run.1'))
+        writer.write_value(b'My data', BytesValueType())
+        writer.write_info({})
+
+        self.assertTrue((self.dir / 'box-id' / 'data' / 'data-id' / 'run.data').exists())
+        self.assertTrue((self.dir / 'box-id' / 'data' / 'data-id' / 'run.info').exists())
+
     def test_delete_run_removes_unknown_run(self):
         writer = self.storage.create_writer(Item('box-id', 'data-id', 'run1'))
         writer.write_info({})
@@ -278,6 +352,18 @@ class TestFileSystemStorage(unittest.TestCase):
 
         self.assertIsNone(run.name)
 
+    def test_renaming_a_run_reads_run_names_once(self):
+        writer = self.storage.create_writer(Item('box-id', 'data1', 'run'), name='item-name')
+        writer.write_info({})
+        self.storage.set_run_name('box-id', 'run', 'My first name')
+
+        with unittest.mock.patch.object(
+            self.storage, '_get_run_names', wraps=self.storage._get_run_names,
+        ) as get_run_names_mock:
+            run = self.storage.set_run_name('box-id', 'run', 'My second name')
+            get_run_names_mock.assert_called_once_with('box-id')
+        self.assertEqual('My second name', run.name)
+
     def test_renaming_a_run_in_invalid_box_id_raises(self):
         writer = self.storage.create_writer(Item('box-id', 'data-id', 'run1'))
         writer.write_info({})
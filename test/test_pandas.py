@@ -1,10 +1,21 @@
 import importlib.abc
+import importlib.util
+import io
+import pathlib
+import shutil
 import sys
+import tempfile
 import unittest
 
 import pandas.errors
 
-from boxs.pandas import PandasDataFrameCsvValueType
+from boxs.box import Box
+from boxs.box_registry import unregister_box
+from boxs.checksum import ChecksumTransformer
+from boxs.filesystem import FileSystemStorage
+from boxs.io import DelegatingStream
+from boxs.pandas import PandasDataFrameCsvValueType, PandasDataFrameParquetValueType
+from boxs.statistics import StatisticsTransformer
 from boxs.value_types import ValueType
 
 from .test_value_types import DummyReader, DummyWriter
@@ -24,6 +35,8 @@ class TestPandasDataFrameCsvValueType(unittest.TestCase):
                 return
         meta_finder = ForceImportErrorFinder()
         sys.meta_path.insert(0, meta_finder)
+        pandas_module = sys.modules['pandas']
+        boxs_pandas_module = sys.modules['boxs.pandas']
         try:
             del sys.modules['pandas']
             del sys.modules['boxs.pandas']
@@ -35,8 +48,11 @@ class TestPandasDataFrameCsvValueType(unittest.TestCase):
                     'pandas specific value types are not available.',
                 ])
             self.assertFalse(hasattr(reloaded_module, 'PandasDataFrameCsvValueType'))
+            self.assertFalse(hasattr(reloaded_module, 'PandasDataFrameParquetValueType'))
         finally:
             sys.meta_path.remove(meta_finder)
+            sys.modules['pandas'] = pandas_module
+            sys.modules['boxs.pandas'] = boxs_pandas_module
 
     def test_supports_requires_data_frame(self):
         value_type = PandasDataFrameCsvValueType()
@@ -118,6 +134,18 @@ class TestPandasDataFrameCsvValueType(unittest.TestCase):
         value_type.write_value_to_writer(value, self.writer)
         self.assertEqual(b',a,b\n0,1,2\n1,2,3\n', self.writer.content)
 
+    def test_value_writes_complete_content_to_raw_stream(self):
+        value = pandas.DataFrame({
+            'a': [1, 2],
+            'b': ['2', '3'],
+        })
+        raw_stream = DelegatingStream(self.writer.stream)
+        self.writer.as_stream = lambda: raw_stream
+        value_type = PandasDataFrameCsvValueType()
+        value_type.write_value_to_writer(value, self.writer)
+        self.assertEqual(b',a,b\n0,1,2\n1,2,3\n', self.writer.content)
+        self.assertTrue(self.writer.closed)
+
     def test_default_encoding_is_utf8(self):
         value = pandas.DataFrame({
             'a': [1, 2],
@@ -166,5 +194,100 @@ class TestPandasDataFrameCsvValueType(unittest.TestCase):
         self.assertEqual(value_type._default_encoding, recreated_value_type._default_encoding)
 
 
+class TestPandasDataFrameCsvValueTypeInBox(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = pathlib.Path(tempfile.mkdtemp())
+        self.box = Box(
+            'pandas-box',
+            FileSystemStorage(self.dir),
+            StatisticsTransformer(),
+            ChecksumTransformer(),
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+        unregister_box(self.box.box_id)
+
+    def test_value_can_be_stored_with_transformers(self):
+        value = pandas.DataFrame({
+            'a': [1, 2],
+            'b': ['2', '3'],
+        })
+        data = self.box.store(
+            value, origin='origin', value_type=PandasDataFrameCsvValueType(),
+        )
+        self.assertEqual(17, data.meta['size_in_bytes'])
+        self.assertEqual(3, data.meta['number_of_lines'])
+        self.assertIn('checksum_digest', data.meta)
+        result = data.load()
+        self.assertEqual([1, 2], result.to_dict('list')['a'])
+        self.assertEqual([2, 3], result.to_dict('list')['b'])
+
+
+@unittest.skipIf(importlib.util.find_spec('pyarrow') is None, "pyarrow not installed")
+class TestPandasDataFrameParquetValueType(unittest.TestCase):
+
+    def setUp(self):
+        self.reader = DummyReader()
+        self.writer = DummyWriter()
+
+    def test_supports_requires_data_frame(self):
+        value_type = PandasDataFrameParquetValueType()
+        value = pandas.DataFrame()
+        self.assertTrue(value_type.supports(value))
+        self.assertFalse(value_type.supports([1, 2, 3]))
+
+    def test_written_value_can_be_read(self):
+        value = pandas.DataFrame({
+            'a': [1, 2],
+            'b': ['äöüß', 'ÄÖÜ'],
+        })
+        value_type = PandasDataFrameParquetValueType()
+        value_type.write_value_to_writer(value, self.writer)
+        self.assertTrue(self.writer.closed)
+        self.reader.set_content(self.writer.content)
+        result = value_type.read_value_from_reader(self.reader)
+        self.assertTrue(self.reader.closed)
+        pandas.testing.assert_frame_equal(value, result)
+
+    def test_value_can_be_read_from_raw_stream(self):
+        value = pandas.DataFrame({'a': [1, 2]})
+        value_type = PandasDataFrameParquetValueType()
+        value_type.write_value_to_writer(value, self.writer)
+        raw_stream = DelegatingStream(io.BytesIO(self.writer.content))
+        self.reader.as_stream = lambda: raw_stream
+        result = value_type.read_value_from_reader(self.reader)
+        pandas.testing.assert_frame_equal(value, result)
+
+    def test_get_specification_returns_class_and_module_name(self):
+        value_type = PandasDataFrameParquetValueType()
+        specification = value_type.get_specification()
+        self.assertEqual('boxs.pandas:PandasDataFrameParquetValueType:zstd', specification)
+
+    def test_can_be_recreated_with_non_default_compression(self):
+        value_type = PandasDataFrameParquetValueType(default_compression='gzip')
+        specification = value_type.get_specification()
+        recreated_value_type = ValueType.from_specification(specification)
+        self.assertIsInstance(recreated_value_type, PandasDataFrameParquetValueType)
+        self.assertEqual('gzip', recreated_value_type._default_compression)
+
+    def test_can_be_recreated_without_compression(self):
+        value_type = PandasDataFrameParquetValueType(default_compression=None)
+        specification = value_type.get_specification()
+        self.assertEqual('boxs.pandas:PandasDataFrameParquetValueType:', specification)
+        recreated_value_type = ValueType.from_specification(specification)
+        self.assertIsInstance(recreated_value_type, PandasDataFrameParquetValueType)
+        self.assertIsNone(recreated_value_type._default_compression)
+
+    def test_written_value_without_compression_can_be_read(self):
+        value = pandas.DataFrame({'a': [1, 2]})
+        value_type = PandasDataFrameParquetValueType(default_compression=None)
+        value_type.write_value_to_writer(value, self.writer)
+        self.reader.set_content(self.writer.content)
+        result = value_type.read_value_from_reader(self.reader)
+        pandas.testing.assert_frame_equal(value, result)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -38,6 +38,19 @@ class TestStatisticsTransformer(unittest.TestCase):
 
         self.assertEqual(5, transformed_writer.meta['number_of_lines'])
 
+    def test_transformed_writer_counts_memoryview_and_returns_written_size(self):
+        writer = unittest.mock.MagicMock()
+        writer.meta = {}
+        writer.as_stream.return_value = io.BytesIO()
+        transformed_writer = self.transformer.transform_writer(writer)
+
+        with transformed_writer.as_stream() as stream:
+            written = stream.write(memoryview(b'content\nwith\nlines\n'))
+
+        self.assertEqual(19, written)
+        self.assertEqual(19, transformed_writer.meta['size_in_bytes'])
+        self.assertEqual(3, transformed_writer.meta['number_of_lines'])
+
     @unittest.skipIf(sys.version_info < (3, 7), "not supported in python < 3.7")
     def test_transformed_writer_sets_start_and_end_time_in_timestamp_format(self):
         writer = unittest.mock.MagicMock()
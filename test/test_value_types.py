@@ -284,6 +284,26 @@ class TestFileValueType(unittest.TestCase):
         value_type.write_value_to_writer(self.file_path, self.writer)
         self.assertEqual(b'This is a bytes string' * 1000, self.writer.content)
 
+    def test_value_writes_complete_content_to_file_stream(self):
+        self.file_path.write_text('This is a bytes string' * 1000)
+        with tempfile.NamedTemporaryFile(delete=False) as destination_file:
+            destination_path = pathlib.Path(destination_file.name)
+        self.addCleanup(destination_path.unlink)
+        self.writer.as_stream = lambda: destination_path.open('wb')
+        value_type = FileValueType()
+        value_type.write_value_to_writer(self.file_path, self.writer)
+        self.assertEqual(b'This is a bytes string' * 1000, destination_path.read_bytes())
+
+    def test_to_result_reads_complete_content_from_file_stream(self):
+        with tempfile.NamedTemporaryFile(delete=False) as source_file:
+            source_path = pathlib.Path(source_file.name)
+        self.addCleanup(source_path.unlink)
+        source_path.write_bytes(b'My bytes content' * 1000)
+        self.reader.as_stream = lambda: source_path.open('rb')
+        value_type = FileValueType(file_path=self.file_path)
+        file_path = value_type.read_value_from_reader(self.reader)
+        self.assertEqual(b'My bytes content' * 1000, file_path.read_bytes())
+
     def test_get_specification_returns_class_and_module_name(self):
         value_type = FileValueType()
         specification = value_type.get_specification()
@@ -418,6 +438,12 @@ class TestStringValueType(unittest.TestCase):
         result = value_type.read_value_from_reader(self.reader)
         self.assertEqual('MULTIBYTE', result)
 
+    def test_to_result_translates_newlines(self):
+        self.reader.set_content(b'Windows\r\nMac\rUnix\n')
+        value_type = StringValueType()
+        result = value_type.read_value_from_reader(self.reader)
+        self.assertEqual('Windows\nMac\nUnix\n', result)
+
     def test_empty_value_writes_nothing(self):
         value_type = StringValueType()
         value_type.write_value_to_writer('', self.writer)